@@ -13,18 +13,33 @@ logger = setup_logger(__name__)
 
 def main():
     parser = argparse.ArgumentParser(description="LLM Evaluation Pipeline")
-    parser.add_argument("--chat", type=str, required=True, help="Path to chat JSON file")
-    parser.add_argument("--context", type=str, required=True, help="Path to context JSON file")
-    parser.add_argument("--output", type=str, default="result.json", help="Path to output JSON file")
+    parser.add_argument("--chat", type=str, nargs="+", required=True, help="Path(s) to chat JSON file(s)")
+    parser.add_argument("--context", type=str, nargs="+", required=True, help="Path(s) to context JSON file(s), one per chat file")
+    parser.add_argument("--output", type=str, nargs="+", default=["result.json"], help="Path(s) to output JSON file(s), one per chat file")
+    parser.add_argument("--mode", choices=["sync", "spool", "ingest"], default="sync",
+                        help="sync: evaluate now; spool: write prompts to a batch file; ingest: evaluate from a batch results file")
+    parser.add_argument("--batch-file", type=str, default="batch_requests.jsonl", help="Batch request JSONL file written by --mode spool and read back by --mode ingest")
+    parser.add_argument("--results-file", type=str, default="batch_results.jsonl", help="Batch results JSONL file read by --mode ingest")
     
     args = parser.parse_args()
+    if len(args.chat) != len(args.context):
+        parser.error("--chat and --context must be given the same number of files")
+    if args.mode != "spool" and len(args.output) != len(args.chat):
+        parser.error("--output must be given one file per chat file")
+    pairs = list(zip(args.chat, args.context))
 
     try:
         # Validate config (e.g. check API key)
         # Config.validate() # Commented out to allow running without API key for testing structure
         
         pipeline = EvaluationPipeline()
-        pipeline.run(args.chat, args.context, args.output)
+        if args.mode == "spool":
+            pipeline.spool(pairs, args.batch_file)
+        elif args.mode == "ingest":
+            pipeline.ingest(pairs, args.batch_file, args.results_file, args.output)
+        else:
+            for (chat_file, context_file), output_file in zip(pairs, args.output):
+                pipeline.run(chat_file, context_file, output_file)
         
     except Exception as e:
         logger.error(f"Pipeline failed: {e}")
@@ -37,4 +52,8 @@ if __name__ == "__main__":
     Run Command 
     python main.py --chat samples/sample-chat-conversation-01.json --context samples/sample_context_vectors-01.json --output output/response1.json
 
+    Deferred batch mode (spool prompts, submit the file to the batch endpoint, then ingest the results)
+    python main.py --mode spool --chat samples/sample-chat-conversation-01.json samples/sample-chat-conversation-02.json --context samples/sample_context_vectors-01.json samples/sample_context_vectors-02.json --batch-file batch_requests.jsonl
+    python main.py --mode ingest --chat samples/sample-chat-conversation-01.json samples/sample-chat-conversation-02.json --context samples/sample_context_vectors-01.json samples/sample_context_vectors-02.json --batch-file batch_requests.jsonl --results-file batch_results.jsonl --output output/response1.json output/response2.json
+
 """
\ No newline at end of file
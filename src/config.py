@@ -22,6 +22,29 @@ class Config:
     BATCH_SIZE = int(os.getenv("BATCH_SIZE", "10"))
     SAMPLING_RATE = float(os.getenv("SAMPLING_RATE", "1.0"))
 
+    # Token Budgeting
+    COST_MODEL = os.getenv("COST_MODEL", GROQ_MODEL_RELEVANCE)
+    CONTEXT_TOKEN_BUDGET = int(os.getenv("CONTEXT_TOKEN_BUDGET", "3000"))
+    RESERVED_OUTPUT_TOKENS = int(os.getenv("RESERVED_OUTPUT_TOKENS", "256"))
+
+    # USD per 1M tokens as (input, output); "default" covers unknown models
+    MODEL_PRICING = {
+        "llama-3.3-70b-versatile": (0.59, 0.79),
+        "llama-3.1-8b-instant": (0.05, 0.08),
+        "mixtral-8x7b-32768": (0.24, 0.24),
+        "gemma2-9b-it": (0.20, 0.20),
+        "default": (0.27, 0.27),
+    }
+
+    # Maximum prompt + completion tokens per model
+    MODEL_CONTEXT_WINDOWS = {
+        "llama-3.3-70b-versatile": 131072,
+        "llama-3.1-8b-instant": 131072,
+        "mixtral-8x7b-32768": 32768,
+        "gemma2-9b-it": 8192,
+        "default": 8192,
+    }
+
     # Logging
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
     LOG_FILE = os.getenv("LOG_FILE", "evaluation.log")
@@ -3,6 +3,7 @@ import os
 from typing import Dict, Any
 from ..logger import setup_logger
 from .schema_validator import validate_chat_schema, validate_context_schema
+from ..llm_service.token_counter import count_tokens
 
 logger = setup_logger(__name__)
 
@@ -32,11 +33,23 @@ def load_context_data(file_path: str) -> Dict[str, Any]:
     if not validate_context_schema(data):
         logger.warning(f"Context data in {file_path} might not match expected schema.")
     
+    vectors = data['data'].get('vector_data', [])
+    vectors_info = data['data'].get('sources', {}).get('vectors_info', [])
+
+    # Token counts per chunk: vector_data 'tokens' first, then vectors_info
+    # 'tokens_count', counting locally only where neither is available
+    info_tokens = {v.get('vector_id'): v.get('tokens_count') for v in vectors_info}
+    chunk_tokens = []
+    for v in vectors:
+        tokens = v.get('tokens') if v.get('tokens') is not None else info_tokens.get(v.get('id'))
+        chunk_tokens.append(tokens if tokens is not None else count_tokens(v.get('text', '')))
+
     # Extract relevant context fields as per GEMINI.md
     context = {
-        'vectors': data['data'].get('vector_data', []),
-        'retrieval_scores': [v['score'] for v in data['data'].get('sources', {}).get('vectors_info', [])],
-        'total_context_tokens': sum(v.get('tokens', 0) for v in data['data'].get('vector_data', [])),
+        'vectors': vectors,
+        'retrieval_scores': [v['score'] for v in vectors_info],
+        'chunk_tokens': chunk_tokens,
+        'total_context_tokens': sum(chunk_tokens),
         'sources_used': data['data'].get('sources', {}).get('vectors_used', [])
     }
     return context
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 class BaseEvaluator(ABC):
     @abstractmethod
@@ -9,3 +9,10 @@ class BaseEvaluator(ABC):
         Returns a dictionary of metrics.
         """
         pass
+
+    def build_prompts(self, features: Dict[str, Any]) -> List[Dict[str, str]]:
+        """
+        Returns the LLM prompts evaluate() would send for these features,
+        as dicts with 'prompt' and 'model'. Used to spool deferred batches.
+        """
+        return []
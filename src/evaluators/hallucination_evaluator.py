@@ -1,6 +1,7 @@
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 from .base_evaluator import BaseEvaluator
 from ..llm_service import GroqClient, HALLUCINATION_PROMPT
+from ..llm_service.token_counter import count_tokens, get_context_budget, pack_context
 from ..config import Config
 
 class HallucinationEvaluator(BaseEvaluator):
@@ -8,22 +9,14 @@ class HallucinationEvaluator(BaseEvaluator):
         self.client = GroqClient()
 
     def evaluate(self, features: Dict[str, Any]) -> Dict[str, Any]:
-        claims = features.get('response_sentences', [])
-        context_chunks = features.get('context_chunks', [])
-        context_text = " ".join(context_chunks) # Simplified context joining
-
         supported_count = 0
         unsupported_count = 0
         contradicted_count = 0
         
         claim_results = []
 
-        for claim in claims:
-            # Basic filtering for very short claims
-            if len(claim.split()) < 3:
-                continue
-
-            result = self._verify_claim(claim, context_text)
+        for claim, prompt in self._claim_prompts(features):
+            result = self._verify_claim(prompt)
             claim_results.append({'claim': claim, 'status': result})
 
             if result == 'SUPPORTED':
@@ -47,11 +40,34 @@ class HallucinationEvaluator(BaseEvaluator):
             'claim_details': claim_results
         }
 
-    def _verify_claim(self, claim: str, context: str) -> str:
-        # Optimization: Check for simple keyword overlap first
-        # (This is a simplified heuristic, real implementation would be more robust)
-        
-        prompt = HALLUCINATION_PROMPT.format(claim=claim, context=context[:10000]) # Truncate context if too long
+    def build_prompts(self, features: Dict[str, Any]) -> List[Dict[str, str]]:
+        return [
+            {'prompt': prompt, 'model': Config.GROQ_MODEL_HALLUCINATION}
+            for _, prompt in self._claim_prompts(features)
+        ]
+
+    def _claim_prompts(self, features: Dict[str, Any]) -> List[Tuple[str, str]]:
+        # Single source of (claim, prompt) pairs for evaluate() and build_prompts()
+        claims = self._filter_claims(features.get('response_sentences', []))
+        context_chunks = features.get('context_chunks', [])
+        context_text = self._build_context(claims, context_chunks, features.get('context_chunk_tokens'))
+        return [(claim, self._format_prompt(claim, context_text)) for claim in claims]
+
+    def _filter_claims(self, claims: List[str]) -> List[str]:
+        # Basic filtering for very short claims
+        return [claim for claim in claims if len(claim.split()) >= 3]
+
+    def _format_prompt(self, claim: str, context: str) -> str:
+        return HALLUCINATION_PROMPT.format(claim=claim, context=context) # Context is pre-packed to the token budget
+
+    def _build_context(self, claims, context_chunks, chunk_tokens=None) -> str:
+        # Pack context once for all claims, leaving room for the longest claim
+        longest_claim = max((count_tokens(c) for c in claims), default=0)
+        overhead = count_tokens(HALLUCINATION_PROMPT.format(claim="", context="")) + longest_claim
+        budget = get_context_budget(Config.GROQ_MODEL_HALLUCINATION, overhead)
+        return pack_context(context_chunks, budget, chunk_tokens)
+
+    def _verify_claim(self, prompt: str) -> str:
         result = self.client.evaluate(prompt, model=Config.GROQ_MODEL_HALLUCINATION)
         
         if "SUPPORTED" in result:
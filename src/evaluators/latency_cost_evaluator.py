@@ -1,5 +1,7 @@
 from typing import Dict, Any
 from .base_evaluator import BaseEvaluator
+from ..llm_service.token_counter import count_tokens, estimate_cost, get_pricing
+from ..config import Config
 import time
 
 class LatencyCostEvaluator(BaseEvaluator):
@@ -8,18 +10,22 @@ class LatencyCostEvaluator(BaseEvaluator):
         # Since we are evaluating offline, we can measure the evaluation overhead
         # or rely on metadata passed in features.
         
-        # Simulating cost calculation based on token counts
-        # Approx cost for Mixtral: $0.27/1M input, $0.27/1M output (Example rates)
+        # Cost calculation from tokenizer counts and the per-model price table.
+        # Context tokens reuse the precomputed chunk counts from the vector store.
+        model = Config.COST_MODEL
+        input_rate, output_rate = get_pricing(model)
         
-        input_tokens = len(features.get('clean_query', '').split()) + features.get('context_tokens', 0)
-        output_tokens = len(features.get('clean_response', '').split())
+        input_tokens = count_tokens(features.get('query', '')) + features.get('context_tokens', 0)
+        output_tokens = count_tokens(features.get('response', ''))
         
-        # Simplified cost estimation
-        estimated_cost = (input_tokens + output_tokens) * (0.27 / 1_000_000)
+        estimated_cost = estimate_cost(model, input_tokens, output_tokens)
         
         return {
+            'model': model,
             'input_tokens': input_tokens,
             'output_tokens': output_tokens,
+            'input_rate_per_1m_usd': input_rate,
+            'output_rate_per_1m_usd': output_rate,
             'estimated_cost_usd': estimated_cost,
             'latency_ms': 0 # Placeholder if not provided in metadata
         }
@@ -1,5 +1,5 @@
 import re
-from typing import Dict, Any
+from typing import Dict, Any, List
 from .base_evaluator import BaseEvaluator
 from ..llm_service import GroqClient, RELEVANCE_PROMPT, COMPLETENESS_PROMPT
 from ..config import Config
@@ -9,11 +9,10 @@ class RelevanceEvaluator(BaseEvaluator):
         self.client = GroqClient()
 
     def evaluate(self, features: Dict[str, Any]) -> Dict[str, Any]:
-        query = features['query']
-        response = features['response']
+        relevance_request, completeness_request = self.build_prompts(features)
 
-        relevance_score = self._get_llm_score(RELEVANCE_PROMPT, query, response)
-        completeness_score = self._get_llm_score(COMPLETENESS_PROMPT, query, response)
+        relevance_score = self._get_llm_score(relevance_request['prompt'])
+        completeness_score = self._get_llm_score(completeness_request['prompt'])
 
         return {
             'relevance_score': relevance_score,
@@ -21,8 +20,15 @@ class RelevanceEvaluator(BaseEvaluator):
             'weighted_relevance': (relevance_score + completeness_score) / 2
         }
 
-    def _get_llm_score(self, template: str, query: str, response: str) -> float:
-        prompt = template.format(query=query, response=response)
+    def build_prompts(self, features: Dict[str, Any]) -> List[Dict[str, str]]:
+        query = features['query']
+        response = features['response']
+        return [
+            {'prompt': template.format(query=query, response=response), 'model': Config.GROQ_MODEL_RELEVANCE}
+            for template in (RELEVANCE_PROMPT, COMPLETENESS_PROMPT)
+        ]
+
+    def _get_llm_score(self, prompt: str) -> float:
         result = self.client.evaluate(prompt, model=Config.GROQ_MODEL_RELEVANCE)
         try:
             # Extract first floating point number
@@ -56,6 +56,7 @@ def extract_features(chat_data: Dict[str, Any], context_data: Dict[str, Any]) ->
         # Context features
         'retrieval_count': len(context_data.get('vectors', [])),
         'context_chunks': [v.get('text', '') for v in context_data.get('vectors', [])],
+        'context_chunk_tokens': context_data.get('chunk_tokens', []),
         'context_tokens': context_data.get('total_context_tokens', 0),
         'source_urls': [v.get('source_url') for v in context_data.get('vectors', [])],
         'retrieval_scores': context_data.get('retrieval_scores', []),
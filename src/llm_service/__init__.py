@@ -1,2 +1,4 @@
 from .groq_client import GroqClient
 from .prompt_templates import RELEVANCE_PROMPT, HALLUCINATION_PROMPT, COMPLETENESS_PROMPT
+from .token_counter import count_tokens, truncate_to_tokens, pack_context, estimate_cost, get_context_budget
+from .batch_manager import BatchManager, run_batch_locally
@@ -0,0 +1,161 @@
+import json
+import uuid
+from typing import Any, Callable, Dict, List
+from ..logger import setup_logger
+from .cache_manager import CacheManager
+
+logger = setup_logger(__name__)
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+MANIFEST_SUFFIX = ".manifest.json"
+
+class BatchManager:
+    """
+    Spools prompts to a provider batch request file and loads the matching
+    results file back into the prompt cache. Custom IDs are the cache keys,
+    so they are stable across runs and identical prompts are sent once.
+    A manifest next to the batch file records the settings prompts were
+    built with, so ingest can detect drift.
+    """
+
+    def __init__(self, cache: CacheManager):
+        self.cache = cache
+
+    def write_batch(self, requests: List[Dict[str, str]], batch_file: str, temperature: float = 0.0) -> int:
+        """Writes cache-missing requests to a batch JSONL file. Returns the number written."""
+        written = set()
+        with open(batch_file, 'w', encoding='utf-8') as f:
+            for request in requests:
+                custom_id = self.cache.get_key(request['prompt'])
+                if custom_id in written or self.cache.get(request['prompt']):
+                    continue
+                line = {
+                    'custom_id': custom_id,
+                    'method': 'POST',
+                    'url': BATCH_ENDPOINT,
+                    'body': {
+                        'model': request['model'],
+                        'messages': [{'role': 'user', 'content': request['prompt']}],
+                        'temperature': temperature,
+                    }
+                }
+                f.write(json.dumps(line) + "\n")
+                written.add(custom_id)
+        logger.info(f"Spooled {len(written)} prompts to {batch_file}")
+        return len(written)
+
+    def write_manifest(self, batch_file: str, settings: Dict[str, Any]):
+        with open(batch_file + MANIFEST_SUFFIX, 'w', encoding='utf-8') as f:
+            json.dump({'settings': settings}, f, indent=2)
+
+    def read_manifest(self, batch_file: str) -> Dict[str, Any]:
+        path = batch_file + MANIFEST_SUFFIX
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)['settings']
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Spool manifest not found: {path}")
+
+    def read_batch_prompts(self, batch_file: str) -> Dict[str, str]:
+        """Reads a batch request JSONL file into a custom_id -> prompt mapping."""
+        prompts = {}
+        with open(batch_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                request = json.loads(line)
+                prompts[request['custom_id']] = request['body']['messages'][-1]['content']
+        return prompts
+
+    def read_results(self, results_file: str) -> Dict[str, str]:
+        """Reads a batch results JSONL file into a custom_id -> response text mapping."""
+        results = {}
+        with open(results_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning("Skipping malformed batch result line.")
+                    continue
+                custom_id = entry.get('custom_id')
+                response = entry.get('response') or {}
+                if entry.get('error') or response.get('status_code') != 200:
+                    logger.warning(f"Batch request {custom_id} failed: {entry.get('error')}")
+                    continue
+                try:
+                    content = response['body']['choices'][0]['message']['content']
+                except (KeyError, IndexError, TypeError):
+                    logger.warning(f"Batch request {custom_id} has no completion content.")
+                    continue
+                results[custom_id] = (content or "").strip()
+        return results
+
+    def ingest_results(self, batch_file: str, results_file: str) -> int:
+        """
+        Fills the cache from a results file, keyed by the prompts as spooled in
+        the batch file. Returns the number cached.
+        """
+        prompts = self.read_batch_prompts(batch_file)
+        results = self.read_results(results_file)
+        ingested = 0
+        for custom_id, content in results.items():
+            prompt = prompts.get(custom_id)
+            if prompt is None:
+                logger.warning(f"Batch result {custom_id} does not match any spooled request.")
+                continue
+            self.cache.set(prompt, content)
+            ingested += 1
+        logger.info(f"Ingested {ingested} batch results from {results_file}")
+        if ingested < len(prompts):
+            logger.warning(f"{len(prompts) - ingested} spooled prompts have no usable batch result.")
+        return ingested
+
+
+def run_batch_locally(
+    batch_file: str,
+    results_file: str,
+    responder: Callable[[str, str], str]
+) -> int:
+    """
+    Local stand-in for the provider batch endpoint: answers each request in a
+    batch file with responder(prompt, model) and writes a results file in the
+    provider's format. Empty or raising responses become error entries.
+    """
+    count = 0
+    with open(batch_file, 'r', encoding='utf-8') as src, open(results_file, 'w', encoding='utf-8') as dst:
+        for line in src:
+            if not line.strip():
+                continue
+            request = json.loads(line)
+            body = request['body']
+            result = {
+                'id': f"batch_req_{uuid.uuid4().hex}",
+                'custom_id': request['custom_id'],
+                'response': None,
+                'error': None
+            }
+            try:
+                content = responder(body['messages'][-1]['content'], body['model'])
+            except Exception as e:
+                content = None
+                result['error'] = {'code': 'responder_error', 'message': str(e)}
+            if content:
+                result['response'] = {
+                    'status_code': 200,
+                    'body': {
+                        'model': body['model'],
+                        'choices': [{
+                            'index': 0,
+                            'message': {'role': 'assistant', 'content': content},
+                            'finish_reason': 'stop'
+                        }]
+                    }
+                }
+            elif result['error'] is None:
+                result['error'] = {'code': 'empty_response', 'message': "Responder returned no content."}
+            dst.write(json.dumps(result) + "\n")
+            count += 1
+    logger.info(f"Wrote {count} local batch results to {results_file}")
+    return count
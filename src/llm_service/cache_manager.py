@@ -9,11 +9,11 @@ class CacheManager:
         if not os.path.exists(cache_dir):
             os.makedirs(cache_dir)
 
-    def _get_key(self, prompt: str) -> str:
+    def get_key(self, prompt: str) -> str:
         return hashlib.md5(prompt.encode('utf-8')).hexdigest()
 
     def get(self, prompt: str) -> Optional[str]:
-        key = self._get_key(prompt)
+        key = self.get_key(prompt)
         path = os.path.join(self.cache_dir, f"{key}.json")
         if os.path.exists(path):
             with open(path, 'r', encoding='utf-8') as f:
@@ -21,7 +21,7 @@ class CacheManager:
         return None
 
     def set(self, prompt: str, response: str):
-        key = self._get_key(prompt)
+        key = self.get_key(prompt)
         path = os.path.join(self.cache_dir, f"{key}.json")
         with open(path, 'w', encoding='utf-8') as f:
             json.dump({'prompt': prompt, 'response': response}, f)
@@ -0,0 +1,126 @@
+import re
+from functools import lru_cache
+from typing import List, Optional, Tuple
+from ..config import Config
+
+# Loaded on first use: tiktoken may download the encoding file, which must
+# not happen (or hang) at import time. Success and failure are both cached.
+_ENCODING = None
+_ENCODING_LOADED = False
+
+# Fallback approximation: 1.3 tokens per word, kept as an integer ratio so
+# counting and truncation agree exactly. Within a few percent of the vector
+# store's own token totals on the sample context files.
+_WORD_PATTERN = re.compile(r"\w+")
+_TOKENS_PER_WORD = (13, 10)
+
+
+def _get_encoding():
+    """
+    Returns tiktoken's cl100k_base encoding, or None if unavailable.
+    cl100k_base is OpenAI's tokenizer, not Llama's, so counts for the Groq
+    Llama models are approximate, as is the regex fallback. Both are mixed
+    with the vector store's own precomputed chunk token counts.
+    """
+    global _ENCODING, _ENCODING_LOADED
+    if not _ENCODING_LOADED:
+        _ENCODING_LOADED = True
+        try:
+            import tiktoken
+            _ENCODING = tiktoken.get_encoding("cl100k_base")
+        except Exception:
+            # tiktoken missing or its encoding files unavailable offline
+            _ENCODING = None
+    return _ENCODING
+
+
+def get_tokenizer_name() -> str:
+    """Names the tokenizer in use, so prompt builds can be compared across runs."""
+    return "cl100k_base" if _get_encoding() is not None else "regex"
+
+
+@lru_cache(maxsize=Config.CACHE_SIZE)
+def count_tokens(text: str) -> int:
+    """Counts tokens in text with the local tokenizer. Results are memoized."""
+    if not text:
+        return 0
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    numerator, denominator = _TOKENS_PER_WORD
+    return -(-len(_WORD_PATTERN.findall(text)) * numerator // denominator)
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cuts text down to at most max_tokens tokens."""
+    if max_tokens <= 0 or not text:
+        return ""
+    if count_tokens(text) <= max_tokens:
+        return text
+    encoding = _get_encoding()
+    if encoding is not None:
+        tokens = encoding.encode(text, disallowed_special=())
+        return encoding.decode(tokens[:max_tokens])
+    numerator, denominator = _TOKENS_PER_WORD
+    max_words = max_tokens * denominator // numerator
+    end = 0
+    for i, match in enumerate(_WORD_PATTERN.finditer(text)):
+        if i == max_words:
+            break
+        end = match.end()
+    return text[:end]
+
+
+def get_pricing(model: str) -> Tuple[float, float]:
+    """Returns (input, output) USD rates per 1M tokens for a model."""
+    return Config.MODEL_PRICING.get(model, Config.MODEL_PRICING["default"])
+
+
+def estimate_cost(model: str, input_tokens: int, output_tokens: int) -> float:
+    """Estimates USD cost of a call from its token counts."""
+    input_rate, output_rate = get_pricing(model)
+    return (input_tokens * input_rate + output_tokens * output_rate) / 1_000_000
+
+
+def get_context_budget(model: str, prompt_overhead: int = 0) -> int:
+    """
+    Tokens available for context in a prompt to the given model: the configured
+    budget, clipped to what is left of the context window after the rest of the
+    prompt and the reserved completion.
+    """
+    window = Config.MODEL_CONTEXT_WINDOWS.get(model, Config.MODEL_CONTEXT_WINDOWS["default"])
+    available = window - Config.RESERVED_OUTPUT_TOKENS - prompt_overhead
+    return max(0, min(Config.CONTEXT_TOKEN_BUDGET, available))
+
+
+def pack_context(
+    chunks: List[str],
+    budget: int,
+    chunk_tokens: Optional[List[Optional[int]]] = None,
+    separator: str = " "
+) -> str:
+    """
+    Joins chunks in order until the token budget is spent. Precomputed chunk
+    token counts are used where given; the chunk that overflows the budget
+    is truncated and packing stops.
+    """
+    packed = []
+    used = 0
+    separator_tokens = count_tokens(separator)
+    for i, chunk in enumerate(chunks):
+        if not chunk:
+            continue
+        tokens = chunk_tokens[i] if chunk_tokens and i < len(chunk_tokens) else None
+        if tokens is None:
+            tokens = count_tokens(chunk)
+        cost = tokens + (separator_tokens if packed else 0)
+        if used + cost <= budget:
+            packed.append(chunk)
+            used += cost
+            continue
+        remaining = budget - used - (separator_tokens if packed else 0)
+        truncated = truncate_to_tokens(chunk, remaining)
+        if truncated:
+            packed.append(truncated)
+        break
+    return separator.join(packed)
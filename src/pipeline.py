@@ -1,11 +1,15 @@
 import time
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 
+from .config import Config
 from .data_loader import load_chat_data, load_context_data
 from .feature_extraction import extract_features
 from .evaluators import RelevanceEvaluator, HallucinationEvaluator, LatencyCostEvaluator
 from .aggregation import aggregate_results
 from .output import print_summary, generate_report
+from .llm_service import BatchManager
+from .llm_service.cache_manager import CacheManager
+from .llm_service.token_counter import get_tokenizer_name
 from .logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -19,7 +23,83 @@ class EvaluationPipeline:
     def run(self, chat_file: str, context_file: str, output_file: str = "result.json"):
         logger.info("Starting Evaluation Pipeline...")
         start_time = time.time()
+        features = self._extract(chat_file, context_file)
+        return self._evaluate(features, chat_file, context_file, output_file, start_time)
 
+    def spool(self, pairs: List[Tuple[str, str]], batch_file: str) -> int:
+        """
+        Deferred mode, phase 1: extracts features and builds prompts for every
+        (chat_file, context_file) pair, writing cache-missing prompts to a batch file.
+        """
+        logger.info(f"Spooling prompts for {len(pairs)} conversations...")
+        batch_manager = self._batch_manager()
+        requests = [r for _, pair_requests in self._collect_requests(pairs) for r in pair_requests]
+        written = batch_manager.write_batch(requests, batch_file)
+        batch_manager.write_manifest(batch_file, self._prompt_settings())
+        return written
+
+    def ingest(self, pairs: List[Tuple[str, str]], batch_file: str, results_file: str, output_files: List[str]) -> List[Dict[str, Any]]:
+        """
+        Deferred mode, phase 2: loads a batch results file into the cache, then
+        evaluates and aggregates every pair from the cached responses. Never
+        calls the API: pairs with prompts lacking a result are reported as
+        errors and skipped.
+        """
+        logger.info(f"Ingesting batch results from {results_file}...")
+        batch_manager = self._batch_manager()
+        spooled = batch_manager.read_manifest(batch_file)
+        current = self._prompt_settings()
+        drifted = sorted(k for k in set(spooled) | set(current) if spooled.get(k) != current.get(k))
+        if drifted:
+            raise ValueError(
+                f"Prompt settings changed since spool ({', '.join(drifted)}); "
+                "restore them or re-run spool before ingesting."
+            )
+        batch_manager.ingest_results(batch_file, results_file)
+
+        results = []
+        for (features, requests), (chat_file, context_file), output_file in zip(self._collect_requests(pairs), pairs, output_files):
+            missing = [r for r in requests if not batch_manager.cache.get(r['prompt'])]
+            if missing:
+                logger.error(f"{len(missing)} prompts for {chat_file} have no batch result; skipping evaluation.")
+                result = {
+                    'error': 'missing_batch_results',
+                    'missing_prompts': len(missing),
+                    'metadata': {'chat_source': chat_file, 'context_source': context_file}
+                }
+                generate_report(result, output_file)
+                results.append(result)
+                continue
+            results.append(self._evaluate(features, chat_file, context_file, output_file, time.time()))
+        return results
+
+    def _batch_manager(self) -> BatchManager:
+        if not Config.ENABLE_CACHING:
+            raise ValueError("Deferred batch mode requires ENABLE_CACHING=true.")
+        return BatchManager(CacheManager())
+
+    def _prompt_settings(self) -> Dict[str, Any]:
+        # Everything prompt text depends on besides the input files
+        return {
+            'groq_model_relevance': Config.GROQ_MODEL_RELEVANCE,
+            'groq_model_hallucination': Config.GROQ_MODEL_HALLUCINATION,
+            'context_token_budget': Config.CONTEXT_TOKEN_BUDGET,
+            'reserved_output_tokens': Config.RESERVED_OUTPUT_TOKENS,
+            'tokenizer': get_tokenizer_name()
+        }
+
+    def _collect_requests(self, pairs: List[Tuple[str, str]]) -> List[Tuple[Dict[str, Any], List[Dict[str, str]]]]:
+        # Returns each pair's features with its prompts, so pairs are extracted once
+        collected = []
+        for chat_file, context_file in pairs:
+            features = self._extract(chat_file, context_file)
+            requests = []
+            for evaluator in (self.relevance_evaluator, self.hallucination_evaluator, self.latency_evaluator):
+                requests.extend(evaluator.build_prompts(features))
+            collected.append((features, requests))
+        return collected
+
+    def _extract(self, chat_file: str, context_file: str) -> Dict[str, Any]:
         # 1. Load Data
         logger.info("Loading data...")
         chat_data = load_chat_data(chat_file)
@@ -27,15 +107,16 @@ class EvaluationPipeline:
 
         # 2. Extract Features
         logger.info("Extracting features...")
-        features = extract_features(chat_data, context_data)
+        return extract_features(chat_data, context_data)
 
+    def _evaluate(self, features: Dict[str, Any], chat_file: str, context_file: str, output_file: str, start_time: float):
         # 3. Evaluate Dimensions (could be parallelized)
         logger.info("Evaluating Relevance & Completeness...")
         relevance_metrics = self.relevance_evaluator.evaluate(features)
-        
+
         logger.info("Evaluating Hallucination & Accuracy...")
         hallucination_metrics = self.hallucination_evaluator.evaluate(features)
-        
+
         logger.info("Calculating Latency & Costs...")
         latency_metrics = self.latency_evaluator.evaluate(features)
 
@@ -46,14 +127,14 @@ class EvaluationPipeline:
             hallucination_metrics,
             latency_metrics
         )
-        
+
         # Add metadata
         final_result['metadata'] = {
             'execution_time_sec': round(time.time() - start_time, 2),
             'chat_source': chat_file,
             'context_source': context_file
         }
-        
+
         # Add original query/response for context in report
         final_result['input_data'] = {
             'query': features['query'],
@@ -63,6 +144,6 @@ class EvaluationPipeline:
         # 5. Output
         print_summary(final_result)
         generate_report(final_result, output_file)
-        
+
         logger.info("Pipeline execution complete.")
         return final_result
@@ -0,0 +1,4 @@
+import os
+
+# Keep test runs from writing evaluation.log into the working tree
+os.environ.setdefault("LOG_FILE", "")
@@ -0,0 +1,33 @@
+import json
+from src.data_loader import load_context_data
+from src.llm_service.token_counter import count_tokens
+
+
+def test_load_context_data_chunk_tokens_fallback(tmp_path):
+    data = {
+        "status": "success",
+        "data": {
+            "vector_data": [
+                {"id": 1, "text": "first", "tokens": 5},
+                {"id": 2, "text": "second"},
+                {"id": 3, "text": "third chunk text"},
+            ],
+            "sources": {
+                "vectors_info": [
+                    {"vector_id": 1, "score": 0.5, "tokens_count": 9},
+                    {"vector_id": 2, "score": 0.4, "tokens_count": 7},
+                ],
+                "vectors_used": [1],
+            },
+        },
+    }
+    path = tmp_path / "context.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+    context = load_context_data(str(path))
+
+    # vector_data.tokens wins, then vectors_info.tokens_count, else a local count
+    local = count_tokens("third chunk text")
+    assert context["chunk_tokens"] == [5, 7, local]
+    assert context["total_context_tokens"] == 12 + local
+    assert context["retrieval_scores"] == [0.5, 0.4]
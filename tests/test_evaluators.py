@@ -0,0 +1,27 @@
+import pytest
+from src.config import Config
+from src.evaluators import LatencyCostEvaluator
+
+
+def _features(context_tokens):
+    return {'query': '', 'response': '', 'context_tokens': context_tokens}
+
+
+def test_latency_cost_uses_model_rates(monkeypatch):
+    monkeypatch.setattr(Config, "COST_MODEL", "llama-3.1-8b-instant")
+
+    metrics = LatencyCostEvaluator().evaluate(_features(1_000_000))
+
+    assert metrics['model'] == "llama-3.1-8b-instant"
+    assert metrics['input_rate_per_1m_usd'] == 0.05
+    assert metrics['output_rate_per_1m_usd'] == 0.08
+    assert metrics['estimated_cost_usd'] == pytest.approx(0.05)
+
+
+def test_latency_cost_falls_back_to_default_rates(monkeypatch):
+    monkeypatch.setattr(Config, "COST_MODEL", "unknown-model")
+
+    metrics = LatencyCostEvaluator().evaluate(_features(2_000_000))
+
+    assert (metrics['input_rate_per_1m_usd'], metrics['output_rate_per_1m_usd']) == Config.MODEL_PRICING["default"]
+    assert metrics['estimated_cost_usd'] == pytest.approx(0.54)
@@ -0,0 +1,66 @@
+import json
+import os
+import pytest
+from src.config import Config
+from src.llm_service import token_counter
+from src.llm_service.token_counter import count_tokens, truncate_to_tokens, pack_context, get_context_budget
+
+
+@pytest.fixture(autouse=True)
+def regex_tokenizer(monkeypatch):
+    # Pin the regex fallback so counts don't depend on tiktoken being installed
+    monkeypatch.setattr(token_counter, "_ENCODING", None)
+    monkeypatch.setattr(token_counter, "_ENCODING_LOADED", True)
+    count_tokens.cache_clear()
+    yield
+    count_tokens.cache_clear()
+
+
+def test_count_tokens_regex_fallback():
+    # 3 words at 1.3 tokens each, rounded up; punctuation is not counted
+    assert count_tokens("hello, wonderful world") == 4
+    assert count_tokens("") == 0
+
+
+def test_truncate_to_tokens_regex_fallback():
+    assert truncate_to_tokens("hello, wonderful world", 3) == "hello, wonderful"
+    assert count_tokens(truncate_to_tokens("hello, wonderful world", 3)) <= 3
+    assert truncate_to_tokens("short text", 10) == "short text"
+    assert truncate_to_tokens("short text", 0) == ""
+
+
+def test_pack_context_truncates_overflowing_chunk():
+    assert pack_context(["one two", "six ten cat", "dog"], 6) == "one two six ten"
+
+
+def test_pack_context_skips_empty_chunks():
+    assert pack_context(["", "one", ""], 5) == "one"
+
+
+def test_pack_context_prefers_precomputed_counts():
+    # Locally "one two" is 3 tokens and would leave no room for "six"
+    assert pack_context(["one two", "six"], 3) == "one two"
+    assert pack_context(["one two", "six"], 3, chunk_tokens=[1, None]) == "one two six"
+
+
+def test_get_context_budget_clips_to_window(monkeypatch):
+    monkeypatch.setattr(Config, "CONTEXT_TOKEN_BUDGET", 3000)
+    monkeypatch.setattr(Config, "RESERVED_OUTPUT_TOKENS", 256)
+    window = Config.MODEL_CONTEXT_WINDOWS["gemma2-9b-it"]
+
+    assert get_context_budget("gemma2-9b-it") == 3000
+    assert get_context_budget("gemma2-9b-it", window - 256 - 100) == 100
+    assert get_context_budget("gemma2-9b-it", window * 2) == 0
+
+
+@pytest.mark.parametrize("sample", ["sample_context_vectors-01.json", "sample_context_vectors-02.json"])
+def test_regex_fallback_matches_precomputed_counts(sample):
+    path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "samples", sample)
+    with open(path, 'r', encoding='utf-8') as f:
+        vectors = json.load(f)['data']['vector_data']
+    vectors = [v for v in vectors if v.get('text') and v.get('tokens')]
+
+    precomputed = sum(v['tokens'] for v in vectors)
+    local = sum(count_tokens(v['text']) for v in vectors)
+
+    assert local == pytest.approx(precomputed, rel=0.1)
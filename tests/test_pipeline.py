@@ -0,0 +1,147 @@
+import json
+import os
+import pytest
+from src.config import Config
+from src.llm_service import BatchManager, GroqClient, run_batch_locally
+from src.llm_service.cache_manager import CacheManager
+from src.pipeline import EvaluationPipeline
+
+SAMPLES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "samples")
+CHAT = os.path.join(SAMPLES, "sample-chat-conversation-01.json")
+CONTEXT = os.path.join(SAMPLES, "sample_context_vectors-01.json")
+
+
+class FailingCompletions:
+    """Stands in for the Groq API: any live call is recorded and fails."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def create(self, **kwargs):
+        self.calls += 1
+        raise AssertionError("unexpected live Groq call")
+
+
+def fake_responder(prompt, model):
+    return "SUPPORTED" if "Claim:" in prompt else "0.8"
+
+
+def read_jsonl(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch):
+    # Relative ".cache" resolves under tmp_path for both GroqClient and spool/ingest
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(Config, "ENABLE_CACHING", True)
+    monkeypatch.setattr(Config, "GROQ_API_KEY", "test-key")
+    monkeypatch.setattr(GroqClient, "_instance", None)
+    pipeline = EvaluationPipeline()
+    completions = FailingCompletions()
+    pipeline.relevance_evaluator.client.client.chat.completions = completions
+    return pipeline, completions
+
+
+def test_spool_local_batch_ingest_roundtrip(tmp_path, pipeline):
+    pipeline, completions = pipeline
+    pairs = [(CHAT, CONTEXT), (CHAT, CONTEXT)]
+    requests = [r for _, pair_requests in pipeline._collect_requests(pairs) for r in pair_requests]
+    cache = CacheManager()
+
+    # Already-cached prompts are not spooled
+    cached_prompt = requests[0]['prompt']
+    cache.set(cached_prompt, "0.9")
+
+    batch_file = str(tmp_path / "batch.jsonl")
+    written = pipeline.spool(pairs, batch_file)
+    lines = read_jsonl(batch_file)
+    custom_ids = [line['custom_id'] for line in lines]
+
+    # Duplicate pairs are deduplicated and IDs are stable across runs
+    unique_prompts = {r['prompt'] for r in requests}
+    assert written == len(lines) == len(unique_prompts) - 1
+    assert len(set(custom_ids)) == len(custom_ids)
+    assert cache.get_key(cached_prompt) not in custom_ids
+    pipeline.spool(pairs, str(tmp_path / "batch2.jsonl"))
+    assert [line['custom_id'] for line in read_jsonl(str(tmp_path / "batch2.jsonl"))] == custom_ids
+
+    results_file = str(tmp_path / "results.jsonl")
+    assert run_batch_locally(batch_file, results_file, fake_responder) == len(lines)
+
+    outputs = [str(tmp_path / "r1.json"), str(tmp_path / "r2.json")]
+    results = pipeline.ingest(pairs, batch_file, results_file, outputs)
+
+    assert completions.calls == 0
+    assert len(results) == 2
+    assert results[0]['dimensions']['hallucination']['accuracy_score'] == 1.0
+    assert all(os.path.exists(path) for path in outputs)
+
+
+def _spool_and_answer(tmp_path, pipeline, pairs, responder=fake_responder):
+    batch_file = str(tmp_path / "batch.jsonl")
+    results_file = str(tmp_path / "results.jsonl")
+    pipeline.spool(pairs, batch_file)
+    run_batch_locally(batch_file, results_file, responder)
+    return batch_file, results_file
+
+
+def test_ingest_rejects_budget_change_since_spool(tmp_path, monkeypatch, pipeline):
+    pipeline, completions = pipeline
+    pairs = [(CHAT, CONTEXT)]
+    batch_file, results_file = _spool_and_answer(tmp_path, pipeline, pairs)
+
+    monkeypatch.setattr(Config, "CONTEXT_TOKEN_BUDGET", Config.CONTEXT_TOKEN_BUDGET + 500)
+    with pytest.raises(ValueError, match="context_token_budget"):
+        pipeline.ingest(pairs, batch_file, results_file, [str(tmp_path / "r.json")])
+
+    assert completions.calls == 0
+
+
+def test_ingest_skips_pairs_with_missing_results(tmp_path, pipeline):
+    pipeline, completions = pipeline
+    pairs = [(CHAT, CONTEXT)]
+
+    def responder(prompt, model):
+        # Claim checks fail at the provider
+        return "" if "Claim:" in prompt else "0.8"
+
+    batch_file, results_file = _spool_and_answer(tmp_path, pipeline, pairs, responder)
+    output_file = str(tmp_path / "r.json")
+    results = pipeline.ingest(pairs, batch_file, results_file, [output_file])
+
+    assert completions.calls == 0
+    assert results[0]['error'] == 'missing_batch_results'
+    assert results[0]['missing_prompts'] > 0
+    with open(output_file, 'r', encoding='utf-8') as f:
+        assert json.load(f)['error'] == 'missing_batch_results'
+
+
+def test_read_results_drops_failed_and_malformed_lines(tmp_path):
+    batch_file = str(tmp_path / "batch.jsonl")
+    with open(batch_file, 'w', encoding='utf-8') as f:
+        for custom_id, prompt in [("ok", "good"), ("empty", "blank"), ("raises", "boom")]:
+            f.write(json.dumps({
+                'custom_id': custom_id,
+                'body': {'model': 'm', 'messages': [{'role': 'user', 'content': prompt}]}
+            }) + "\n")
+
+    def responder(prompt, model):
+        if prompt == "boom":
+            raise RuntimeError("provider down")
+        return "" if prompt == "blank" else "answer"
+
+    results_file = str(tmp_path / "results.jsonl")
+    run_batch_locally(batch_file, results_file, responder)
+    entries = {e['custom_id']: e for e in read_jsonl(results_file)}
+    assert entries['empty']['error']['code'] == 'empty_response'
+    assert entries['raises']['error']['code'] == 'responder_error'
+
+    with open(results_file, 'a', encoding='utf-8') as f:
+        f.write("{not json\n")
+        f.write(json.dumps({'custom_id': 'no_choices', 'response': {'status_code': 200, 'body': {}}, 'error': None}) + "\n")
+        f.write(json.dumps({'custom_id': 'http_error', 'response': {'status_code': 500, 'body': {}}, 'error': None}) + "\n")
+
+    manager = BatchManager(CacheManager(str(tmp_path / ".cache")))
+    assert manager.read_results(results_file) == {'ok': 'answer'}